@@ -136,6 +136,22 @@ pub fn convert_space(from: Space, to: Space, pixel: &mut [f32; 3]) {
     }
 }
 
+/// Runs `convert_space` over every pixel in a contiguous buffer.
+/// Prefer this over calling `convert_space` pixel-by-pixel across an FFI boundary.
+pub fn convert_space_chunked(from: Space, to: Space, pixels: &mut [[f32; 3]]) {
+    pixels
+        .iter_mut()
+        .for_each(|pixel| convert_space(from, to, pixel));
+}
+
+/// Same as `convert_space_chunked`, but operates on a flat buffer of 3-channel pixels.
+/// Trailing values that don't fill a whole pixel are left untouched.
+pub fn convert_space_sliced(from: Space, to: Space, pixels: &mut [f32]) {
+    pixels
+        .chunks_exact_mut(3)
+        .for_each(|pixel| unsafe { convert_space(from, to, pixel.try_into().unwrap_unchecked()) });
+}
+
 /// Same as `convert_space`, ignores the 4th value in `pixel`.
 /// Just a convenience function.
 pub fn convert_space_alpha(from: Space, to: Space, pixel: &mut [f32; 4]) {
@@ -148,6 +164,14 @@ pub fn convert_space_alpha(from: Space, to: Space, pixel: &mut [f32; 4]) {
     }
 }
 
+/// Same as `convert_space_chunked`, ignores the 4th value in each pixel.
+/// Lets RGBA buffers be converted without repacking them into 3-channel pixels.
+pub fn convert_space_alpha_chunked(from: Space, to: Space, pixels: &mut [[f32; 4]]) {
+    pixels
+        .iter_mut()
+        .for_each(|pixel| convert_space_alpha(from, to, pixel));
+}
+
 // UP {{{
 
 /// Convert floating (0.0..1.0) RGB to integer (0..255) RGB.
@@ -164,7 +188,8 @@ pub fn srgb_to_irgb(pixel: [f32; 3]) -> [u8; 3] {
 /// Create a hexadecimal string from integer RGB.
 /// Not RGB specific, but other formats typically aren't represented as hexadecimal.
 pub fn irgb_to_hex(pixel: [u8; 3]) -> String {
-    let mut hex = String::from("#");
+    let mut hex = String::with_capacity(7);
+    hex.push('#');
 
     pixel.into_iter().for_each(|c| {
         [c / 16, c % 16]
@@ -559,6 +584,37 @@ mod tests {
         pixcmp(pixel, SRGB)
     }
 
+    #[test]
+    fn chunked() {
+        let mut pixels = [SRGB, HSV, LRGB];
+        convert_space_chunked(Space::SRGB, Space::LCH, &mut pixels);
+        [SRGB, HSV, LRGB]
+            .into_iter()
+            .zip(pixels)
+            .for_each(|(mut pixel, result)| {
+                convert_space(Space::SRGB, Space::LCH, &mut pixel);
+                pixcmp(pixel, result)
+            });
+    }
+
+    #[test]
+    fn sliced() {
+        let mut pixels = [SRGB, HSV, LRGB].concat();
+        convert_space_sliced(Space::SRGB, Space::LCH, &mut pixels);
+        let mut chunked = [SRGB, HSV, LRGB];
+        convert_space_chunked(Space::SRGB, Space::LCH, &mut chunked);
+        assert_eq!(chunked.concat(), pixels);
+    }
+
+    #[test]
+    fn alpha_chunked() {
+        let mut pixels = [SRGB, HSV, LRGB].map(|[a, b, c]| [a, b, c, 0.5]);
+        convert_space_alpha_chunked(Space::SRGB, Space::LCH, &mut pixels);
+        let mut chunked = [SRGB, HSV, LRGB];
+        convert_space_chunked(Space::SRGB, Space::LCH, &mut chunked);
+        assert_eq!(chunked.map(|[a, b, c]| [a, b, c, 0.5]), pixels);
+    }
+
     #[test]
     fn irgb_to() {
         assert_eq!(IRGB, srgb_to_irgb(SRGB))